@@ -1,22 +1,31 @@
 """Main analysis module combining all components."""
 
+import heapq
 import logging
+import time
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
 
 from .config import settings
 from .data_exporter import DataExporter
 from .gemini_generator import GeminiContentGenerator
 from .github_analyzer import GitHubAnalyzer
 from .utils import (
-    format_topics,
+    format_topics_bulk,
+    github_timestamps_to_epochs,
     safe_get,
     validate_github_username,
 )
 
 logger = logging.getLogger(__name__)
 
+# Shared default for repos without topics, avoids allocating an empty list per repo
+_EMPTY: tuple = ()
+
 
 class GitHubProfileAnalyzer:
     """Main analyzer that orchestrates the entire analysis process."""
@@ -46,22 +55,29 @@ class GitHubProfileAnalyzer:
         # Emerging topics
         recent_topics = []
         for repo in all_data["recent_stars"]:
-            if safe_get(repo, "topics"):
-                recent_topics.extend(safe_get(repo, "topics", "").split("|"))
+            recent_topics.extend(repo["topics_list"])
 
         recent_topic_counts = Counter(recent_topics)
-        all_topic_counts = Counter(all_data["all_topics"])
+        all_topic_counts = all_data["all_topics_counter"]
 
-        for topic, recent_count in recent_topic_counts.most_common(10):
+        candidates = []
+        for topic, recent_count in recent_topic_counts.items():
             total_count = all_topic_counts[topic]
-            if recent_count / total_count > 0.3:  # 30% recent
-                trends["emerging_topics"].append(
-                    {
-                        "topic": topic,
-                        "recent_count": recent_count,
-                        "total_count": total_count,
-                    }
-                )
+            if total_count and recent_count / total_count > 0.3:  # 30% recent
+                candidates.append((topic, recent_count, total_count))
+
+        # Rank by how concentrated in the recent window a topic is, breaking
+        # ties by recent volume
+        for topic, recent_count, total_count in heapq.nlargest(
+            10, candidates, key=lambda c: (c[1] / c[2], c[1])
+        ):
+            trends["emerging_topics"].append(
+                {
+                    "topic": topic,
+                    "recent_count": recent_count,
+                    "total_count": total_count,
+                }
+            )
 
         # Growing languages
         recent_languages = [
@@ -75,6 +91,12 @@ class GitHubProfileAnalyzer:
             if count >= 2:
                 trends["growing_languages"].append(lang)
 
+        # Keep the counters and their rankings so prompt generation doesn't
+        # recount or re-sort them
+        trends["_topic_counts"] = all_topic_counts
+        trends["_top_topics"] = all_topic_counts.most_common(25)
+        trends["_top_languages"] = Counter(all_data["all_languages"]).most_common(12)
+
         # Activity pattern
         if all_data["activity"]["commits"] > 50:
             trends["activity_pattern"] = "highly_active"
@@ -105,101 +127,156 @@ class GitHubProfileAnalyzer:
             "own_repos": [],
             "activity": activity,
             "user_info": user_info,
-            "all_topics": [],
+            "all_topics_counter": Counter(),
             "all_languages": [],
             "recent_stars": [],
-            "topic_timeline": defaultdict(list),
             "language_evolution": defaultdict(int),
             "repo_categories": defaultdict(int),
         }
 
-        thirty_days_ago = datetime.now() - timedelta(days=settings.recent_days)
-        ninety_days_ago = datetime.now() - timedelta(days=settings.very_recent_days)
-
-        own_repos_names = {repo["full_name"] for repo in user_repos}
+        now_epoch = time.time()
+        recent_cutoff = now_epoch - settings.recent_days * 86400
+        very_recent_cutoff = now_epoch - settings.very_recent_days * 86400
+        starred_epochs = github_timestamps_to_epochs(item["starred_at"] for item in starred_repos)
+        recent_mask = [epoch > recent_cutoff for epoch in starred_epochs]
+        very_recent_mask = [epoch > very_recent_cutoff for epoch in starred_epochs]
+        starred_insights = self.analyzer.analyze_repos([item["repo"] for item in starred_repos])
+        starred_topics = [item["repo"].get("topics") or _EMPTY for item in starred_repos]
+        starred_topics_fmt = format_topics_bulk(starred_topics)
+        starred_categories_fmt = format_topics_bulk(ins["categories"] for ins in starred_insights)
+
+        own_sources = [repo for repo in user_repos if not repo.get("fork")]
+        updated_epochs = github_timestamps_to_epochs(repo["updated_at"] for repo in own_sources)
+        own_insights = self.analyzer.analyze_repos(own_sources)
+        own_topics = [repo.get("topics") or _EMPTY for repo in own_sources]
+        own_topics_fmt = format_topics_bulk(own_topics)
+        own_categories_fmt = format_topics_bulk(ins["categories"] for ins in own_insights)
+
+        # Bind hot-loop lookups to locals once
+        _all_topics_update = all_data["all_topics_counter"].update
+        _all_languages_append = all_data["all_languages"].append
+        language_evolution = all_data["language_evolution"]
+        repo_categories = all_data["repo_categories"]
+        _starred_append = all_data["starred"].append
+        _own_repos_append = all_data["own_repos"].append
 
         # Process starred repos
-        for item in starred_repos:
+        for item, is_recent, is_very_recent, insights, topics, topics_fmt, categories_fmt in zip(
+            starred_repos,
+            recent_mask,
+            very_recent_mask,
+            starred_insights,
+            starred_topics,
+            starred_topics_fmt,
+            starred_categories_fmt,
+        ):
             repo = item["repo"]
-            starred_at = datetime.strptime(item["starred_at"], "%Y-%m-%dT%H:%M:%SZ")
 
-            topics = safe_get(repo, "topics", [])
-            all_data["all_topics"].extend(topics)
+            if topics:
+                _all_topics_update(topics)
 
-            language = safe_get(repo, "language", "")
+            language = repo.get("language") or ""
             if language:
-                all_data["all_languages"].append(language)
-                all_data["language_evolution"][language] += 1
+                _all_languages_append(language)
+                language_evolution[language] += 1
 
             # Repo insights
-            insights = self.analyzer.extract_repo_insights(repo)
-            for category in insights["categories"]:
-                all_data["repo_categories"][category] += 1
-
-            # Topic timeline
-            for topic in topics:
-                all_data["topic_timeline"][topic].append(starred_at)
+            categories = insights["categories"]
+            for category in categories:
+                repo_categories[category] += 1
 
             repo_info = {
                 "starred_at": item["starred_at"],
                 "name": repo["full_name"],
-                "description": safe_get(repo, "description", ""),
+                "description": repo.get("description") or "",
                 "url": repo["html_url"],
                 "language": language,
-                "topics": format_topics(topics),
-                "stars": safe_get(repo, "stargazers_count", 0),
-                "forks": safe_get(repo, "forks_count", 0),
-                "is_recent": starred_at > thirty_days_ago,
-                "is_very_recent": starred_at > ninety_days_ago,
-                "categories": format_topics(insights["categories"]),
+                "topics": topics_fmt,
+                "topics_list": topics,
+                "stars": repo.get("stargazers_count") or 0,
+                "forks": repo.get("forks_count") or 0,
+                "is_recent": is_recent,
+                "is_very_recent": is_very_recent,
+                "categories": categories_fmt,
             }
 
-            all_data["starred"].append(repo_info)
+            _starred_append(repo_info)
 
-            if repo_info["is_recent"]:
-                all_data["recent_stars"].append(repo_info)
+        all_data["recent_stars"].extend(compress(all_data["starred"], recent_mask))
 
         # Process own repos
-        for repo in user_repos:
-            if safe_get(repo, "fork", False):
-                continue
+        for repo, updated_epoch, topics, topics_fmt, categories_fmt in zip(
+            own_sources, updated_epochs, own_topics, own_topics_fmt, own_categories_fmt
+        ):
+            if topics:
+                _all_topics_update(topics)
 
-            topics = safe_get(repo, "topics", [])
-            all_data["all_topics"].extend(topics)
-
-            language = safe_get(repo, "language", "")
+            language = repo.get("language") or ""
             if language:
-                all_data["all_languages"].append(language)
-
-            updated_at = datetime.strptime(repo["updated_at"], "%Y-%m-%dT%H:%M:%SZ")
-            is_active = updated_at > thirty_days_ago
+                _all_languages_append(language)
 
-            insights = self.analyzer.extract_repo_insights(repo)
+            is_active = updated_epoch > recent_cutoff
 
             repo_info = {
                 "name": repo["full_name"],
-                "description": safe_get(repo, "description", ""),
+                "description": repo.get("description") or "",
                 "url": repo["html_url"],
                 "language": language,
-                "topics": format_topics(topics),
-                "stars": safe_get(repo, "stargazers_count", 0),
-                "forks": safe_get(repo, "forks_count", 0),
+                "topics": topics_fmt,
+                "topics_list": topics,
+                "stars": repo.get("stargazers_count") or 0,
+                "forks": repo.get("forks_count") or 0,
                 "updated_at": repo["updated_at"],
+                "_updated_epoch": updated_epoch,
                 "is_active": is_active,
-                "is_private": safe_get(repo, "private", False),
-                "has_issues": safe_get(repo, "has_issues", False),
-                "open_issues": safe_get(repo, "open_issues_count", 0),
-                "categories": format_topics(insights["categories"]),
-                "size_kb": safe_get(repo, "size", 0),
+                "is_private": repo.get("private") or False,
+                "has_issues": repo.get("has_issues") or False,
+                "open_issues": repo.get("open_issues_count") or 0,
+                "categories": categories_fmt,
+                "size_kb": repo.get("size") or 0,
             }
 
-            all_data["own_repos"].append(repo_info)
+            _own_repos_append(repo_info)
 
         # Sort own repos by activity
-        all_data["own_repos"].sort(key=lambda x: x["updated_at"], reverse=True)
+        all_data["own_repos"].sort(key=itemgetter("_updated_epoch"), reverse=True)
 
         return all_data
 
+    def _fetch_github_data(
+        self, username: str
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fetch the independent GitHub endpoints concurrently.
+
+        Profile, starred and own repos come from a single GraphQL query when
+        a token is available, falling back to the REST endpoints otherwise.
+        Recent events are always fetched via REST alongside.
+
+        Args:
+            username: GitHub username to fetch data for.
+
+        Returns:
+            Tuple of (user info, starred repos, own repos, recent events).
+        """
+        analyzer = self.analyzer
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            recent_activity = executor.submit(analyzer.get_recent_activity, username)
+
+            bundle = analyzer.fetch_profile_bundle(username)
+            if bundle is None:
+                futures = [
+                    executor.submit(fetch, username)
+                    for fetch in (
+                        analyzer.get_user_info,
+                        analyzer.get_starred_repos,
+                        analyzer.get_user_repos,
+                    )
+                ]
+                bundle = [future.result() for future in futures]
+            user_info, starred_repos, user_repos = bundle
+
+            return user_info, starred_repos, user_repos, recent_activity.result()
+
     def run_analysis(self) -> None:
         """Run the complete analysis pipeline."""
         logger.info("🚀 GitHub Profile Analysis Tool")
@@ -211,31 +288,22 @@ class GitHubProfileAnalyzer:
             print("⚠ Invalid GitHub username")
             return
 
-        # 1. Fetch user info
-        print("👤 Fetching user info...")
-        user_info = self.analyzer.get_user_info(settings.github_username)
+        # 1-4. Fetch user info, starred repos, own repos and recent activity
+        print("📡 Fetching user info, starred repos, own repos and recent activity...")
+        user_info, starred_repos, user_repos, recent_activity = self._fetch_github_data(
+            settings.github_username
+        )
         print(f"  → Name: {safe_get(user_info, 'name', 'Not available')}")
         print(f"  → Bio: {safe_get(user_info, 'bio', 'Not available')}")
-
-        # 2. Fetch starred repos
-        print("📡 Fetching starred repos...")
-        starred_repos = self.analyzer.get_starred_repos(settings.github_username)
         print(f"  → Total starred: {len(starred_repos)}")
-
-        # 3. Fetch own repos
-        print("📦 Fetching own repos...")
-        user_repos = self.analyzer.get_user_repos(settings.github_username)
         print(f"  → Total own repos: {len(user_repos)}")
-
-        # 4. Fetch recent activity
-        print("🔄 Fetching recent activity...")
-        recent_activity = self.analyzer.get_recent_activity(settings.github_username)
         print(f"  → Recent events: {len(recent_activity)}")
 
         # 5. Analyze activity
         print("📊 Analyzing activity...")
+        own_repos_names = {repo["full_name"] for repo in user_repos}
         activity_summary = self.analyzer.analyze_recent_activity(
-            recent_activity, {repo["full_name"] for repo in user_repos}
+            recent_activity, own_repos_names
         )
         print(f"  → Commits: {activity_summary['commits']}")
         print(f"  → PRs created: {activity_summary['prs_created']}")
@@ -245,7 +313,7 @@ class GitHubProfileAnalyzer:
         all_data = self.extract_comprehensive_data(
             starred_repos, user_repos, activity_summary, user_info
         )
-        print(f"  → Unique topics: {len(set(all_data['all_topics']))}")
+        print(f"  → Unique topics: {len(all_data['all_topics_counter'])}")
 
         # 7. Identify trends
         print("📈 Identifying trends...")
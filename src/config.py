@@ -17,6 +17,11 @@ class Settings(BaseSettings):
     gemini_model: str = "gemini-2.5-flash"
     blog_rss_url: str = "https://fabioluciano.com/rss-pt.xml"
     resume_repo_base: str = "https://raw.githubusercontent.com/fabioluciano/resume.fabioluciano.com/main/data"
+    resume_prefer_json: bool = False  # Try pre-converted <file>.json before <file>.yaml
+
+    # Cache settings
+    github_cache_name: str = ".ghcache"  # SQLite cache for GitHub API responses
+    content_cache_name: str = ".contentcache"  # SQLite cache for RSS feed and resume files
 
     # Analysis settings
     recent_days: int = 30
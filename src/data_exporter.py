@@ -1,6 +1,7 @@
 """Data export module."""
 
 import os
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .config import settings
@@ -19,22 +20,33 @@ class DataExporter:
         if output_dir and output_dir != ".":
             os.makedirs(output_dir, exist_ok=True)
 
+        pt_bytes = content.get("pt-br", "").encode("utf-8")
+        en_bytes = content.get("en", "").encode("utf-8")
+
         # Save Portuguese version
         pt_filename = os.path.join(output_dir, "README.pt-br.md")
-        with open(pt_filename, "w", encoding="utf-8") as f:
-            f.write(content.get("pt-br", ""))
+        Path(pt_filename).write_bytes(pt_bytes)
         print(f"✓ {pt_filename} updated!")
 
         # Save English version
         en_filename = os.path.join(output_dir, "README.en.md")
-        with open(en_filename, "w", encoding="utf-8") as f:
-            f.write(content.get("en", ""))
+        Path(en_filename).write_bytes(en_bytes)
         print(f"✓ {en_filename} updated!")
 
         # Save main README (Portuguese version as default)
         main_filename = os.path.join(output_dir, settings.readme_filename)
-        with open(main_filename, "w", encoding="utf-8") as f:
-            f.write(content.get("pt-br", ""))
+        if os.path.abspath(main_filename) != os.path.abspath(pt_filename):
+            self._link_or_write(pt_filename, main_filename, pt_bytes)
         print(f"✓ {main_filename} updated!")
 
         return True
+
+    @staticmethod
+    def _link_or_write(source: str, target: str, data: bytes) -> None:
+        """Hardlink target to an already written file, writing the bytes if linking fails."""
+        try:
+            if os.path.lexists(target):
+                os.unlink(target)
+            os.link(source, target)
+        except OSError:
+            Path(target).write_bytes(data)
@@ -1,8 +1,8 @@
 """Gemini AI content generation module."""
 
 import json
-from collections import Counter
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import tenacity
 from google import genai
@@ -13,162 +13,13 @@ from .utils import (
     fetch_blog_posts,
     fetch_resume_data,
     format_skills_for_prompt,
-    format_topics,
     safe_get,
     truncate_text,
 )
 
+_NL = "\n"
 
-class GeminiContentGenerator:
-    """Handles content generation using Gemini AI."""
-
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or settings.gemini_api_key
-        self.client = genai.Client(api_key=self.api_key) if self.api_key else None
-
-    def generate_profile_content(
-        self, all_data: Dict[str, Any], trends: Dict[str, Any]
-    ) -> Optional[Dict[str, str]]:
-        """Generate README content using Gemini AI."""
-        if not self.client:
-            print("⚠ GEMINI_API_KEY not configured")
-            return None
-
-        # Prepare data for prompt
-        topic_counts = Counter(all_data["all_topics"])
-        language_counts = Counter(all_data["all_languages"])
-
-        active_repos = [
-            {
-                **repo,
-                "description": safe_get(repo, "description", ""),
-                "topics": safe_get(repo, "topics", []),
-            }
-            for repo in all_data["own_repos"]
-            if safe_get(repo, "is_active")
-        ][: settings.max_active_repos]
-
-        recent_work = []
-        for commit in all_data["activity"]["recent_commits_detail"][: settings.max_recent_commits]:
-            recent_work.append(f"  • {commit['repo']}: {commit['message'][:60]}...")
-
-        collaboration_context = ""
-        if all_data["activity"]["repos_contributed"]:
-            collaboration_context = f"\n**Contribuindo para projetos externos:**\n" + "\n".join(
-                [f"  • {repo}" for repo in all_data["activity"]["repos_contributed"][:5]]
-            )
-
-        # Fetch blog posts
-        blog_posts = fetch_blog_posts(settings.blog_rss_url, max_posts=5)
-        blog_section = ""
-        if blog_posts:
-            blog_section = "\n## ÚLTIMOS POSTS DO BLOG\n" + "\n".join(
-                [f"- [{p['title']}]({p['link']}) - {p['pub_date']}" for p in blog_posts]
-            )
-
-        # Fetch resume data for tech stack
-        resume_data = fetch_resume_data(settings.resume_repo_base)
-        skills_section = format_skills_for_prompt(resume_data)
-
-        prompt = f"""Você é um especialista em criar perfis GitHub profissionais e envolventes. Analise os dados abaixo e crie um README.md excepcional que conte a história profissional do desenvolvedor de forma autêntica e impactante.
-
-# CONTEXTO COMPLETO DO DESENVOLVEDOR
-
-## INFORMAÇÕES PESSOAIS
-- Nome: {safe_get(all_data["user_info"], "name", settings.github_username)}
-- Bio atual: {safe_get(all_data["user_info"], "bio", "Não definida")}
-- Localização: {safe_get(all_data["user_info"], "location", "Não informada")}
-- Empresa: {safe_get(all_data["user_info"], "company", "Não informada")}
-- Repositórios públicos: {safe_get(all_data["user_info"], "public_repos", 0)}
-- Seguidores: {safe_get(all_data["user_info"], "followers", 0)}
-
-## ÁREAS DE EXPERTISE (OBRIGATÓRIO INCLUIR NO "SOBRE MIM" E "FOCO ATUAL")
-{chr(10).join([f"- {area}" for area in settings.expertise_areas])}
-
-## ATIVIDADE RECENTE (Últimos {settings.recent_days} dias)
-- **Commits:** {all_data["activity"]["commits"]} commits
-- **Pull Requests:** {all_data["activity"]["prs_created"]} criados, {
-            all_data["activity"]["prs_reviewed"]
-        } revisados
-- **Issues:** {all_data["activity"]["issues_opened"]} abertas, {
-            all_data["activity"]["issues_commented"]
-        } comentadas
-- **Repositórios trabalhados:** {len(all_data["activity"]["repos_worked_on"])} repos
-- **Padrão de atividade:** {trends["activity_pattern"]}
-
-## TRABALHO RECENTE EM DETALHES
-{
-            chr(10).join(recent_work)
-            if recent_work
-            else "Nenhum commit recente detectado em repos públicos"
-        }
-{collaboration_context}
-
-## REPOSITÓRIOS PRÓPRIOS ATIVOS
-{
-            chr(10).join(
-                [
-                    f"- **{r['name']}** [{r['language']}]: {truncate_text(safe_get(r, 'description', 'Sem descrição'), 80)} (⭐ {safe_get(r, 'stars', 0)}, 🍴 {safe_get(r, 'forks', 0)})"
-                    for r in active_repos
-                ]
-            )
-            if active_repos
-            else "Sem atividade recente em repositórios próprios"
-        }
-
-## REPOSITÓRIOS COM ESTRELA RECENTES ({len(all_data["recent_stars"])} nos últimos {
-            settings.recent_days
-        } dias)
-{
-            chr(10).join(
-                [
-                    f"- **{r['name']}** [{r['language']}]: {truncate_text(safe_get(r, 'description', 'Sem descrição'), 80)}"
-                    + chr(10)
-                    + f"  Tópicos: {format_topics(safe_get(r, 'topics', '').split('|') if safe_get(r, 'topics') else [])}"
-                    for r in all_data["recent_stars"][: settings.max_recent_stars]
-                ]
-            )
-        }
-
-## ANÁLISE DE TENDÊNCIAS
-
-### Tópicos Emergentes (foco recente)
-{
-            chr(10).join(
-                [
-                    f"- **{t['topic']}**: {t['recent_count']} de {t['total_count']} ocorrências são recentes ({int(t['recent_count'] / t['total_count'] * 100)}%)"
-                    for t in trends["emerging_topics"][:8]
-                ]
-            )
-            if trends["emerging_topics"]
-            else "Nenhum tópico emergente identificado"
-        }
-
-### Linguagens em Crescimento
-{
-            ", ".join(trends["growing_languages"])
-            if trends["growing_languages"]
-            else "Nenhuma tendência identificada"
-        }
-
-### Áreas de Expertise Identificadas
-{", ".join(trends["expertise_areas"]) if trends["expertise_areas"] else "Analisando..."}
-
-## ESTATÍSTICAS GERAIS
-- **Total de estrelas dadas:** {len(all_data["starred"])} repositórios
-- **Repositórios próprios:** {len(all_data["own_repos"])} (não-forks)
-- **Tópicos únicos explorados:** {len(set(all_data["all_topics"]))}
-
-### Top 25 Tópicos (ordenado por frequência)
-{", ".join([f"{t} ({c})" for t, c in topic_counts.most_common(25)])}
-
-### Top 12 Linguagens
-{", ".join([f"{l} ({c})" for l, c in language_counts.most_common(12)])}
-{blog_section}
-
----
-
-# SUA MISSÃO
+_PROMPT_MISSION = """# SUA MISSÃO
 
 Crie um README.md profissional, moderno e impactante seguindo estas diretrizes:
 
@@ -222,11 +73,9 @@ Crie um README.md profissional, moderno e impactante seguindo estas diretrizes:
 
 **CRÍTICO - COPIE EXATAMENTE**: Os badges abaixo já estão prontos. Copie-os exatamente como estão.
 **NÃO adicione texto após os badges. NÃO adicione tecnologias extras.**
-**Use `####` (H4) para subcategorias como "Linguagens de Programação", "Cloud & FinOps", etc.**
+**Use `####` (H4) para subcategorias como "Linguagens de Programação", "Cloud & FinOps", etc.**"""
 
-{skills_section}
-
-### 7. `## 🤝 Contribuições & Colaboração`
+_PROMPT_COLLABORATION = """### 7. `## 🤝 Contribuições & Colaboração`
 - Se houver PRs externos, mencione
 - Convite para colaboração
 - Links para issues/discussions se aplicável
@@ -236,22 +85,15 @@ Crie um README.md profissional, moderno e impactante seguindo estas diretrizes:
 - Use o formato: [Título](link) - data
 - Adicione link para o blog completo
 
-### 9. `## 📫 Como me Encontrar`
-- GitHub: {settings.github_username}
-- Email: {settings.email}
-- LinkedIn: {settings.linkedin}
-- Twitter/X: {settings.twitter}
-- Website/Blog: {settings.website}
+### 9. `## 📫 Como me Encontrar`"""
 
-## DIRETRIZES CRÍTICAS
+_PROMPT_GUIDELINES_HEAD = """## DIRETRIZES CRÍTICAS
 
 1. **AUTENTICIDADE**: O conteúdo deve soar genuíno, não como marketing
 2. **ESPECIFICIDADE**: Use nomes exatos de tecnologias, frameworks, conceitos
-3. **EVIDÊNCIAS**: Tudo deve ser baseado nos dados reais fornecidos
-4. **ATUALIDADE**: Priorize informações dos últimos {settings.recent_days}-{
-            settings.very_recent_days
-        } dias
-5. **PROFISSIONALISMO**: Mantenha tom profissional mas acessível
+3. **EVIDÊNCIAS**: Tudo deve ser baseado nos dados reais fornecidos"""
+
+_PROMPT_GUIDELINES_TAIL = """5. **PROFISSIONALISMO**: Mantenha tom profissional mas acessível
 6. **VISUAL**: Use emojis estrategicamente, não exagere
 7. **CONCISÃO**: Cada seção deve ser scanning-friendly
 8. **COERÊNCIA**: A narrativa deve fazer sentido como um todo
@@ -307,30 +149,201 @@ Sem explicações, sem meta-comentários.
 Comece diretamente com o conteúdo do README em português.
 """
 
+
+class GeminiContentGenerator:
+    """Handles content generation using Gemini AI."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or settings.gemini_api_key
+        self.client = genai.Client(api_key=self.api_key) if self.api_key else None
+        self._gen_config = (
+            types.GenerateContentConfig(temperature=0.7, top_p=0.9, top_k=40)
+            if self.client
+            else None
+        )
+        # Expertise areas come from settings and never change during a run
+        self._expertise_bullets = _NL.join(f"- {area}" for area in settings.expertise_areas)
+
+    def generate_profile_content(
+        self, all_data: Dict[str, Any], trends: Dict[str, Any]
+    ) -> Optional[Dict[str, str]]:
+        """Generate README content using Gemini AI."""
+        if not self.client:
+            print("⚠ GEMINI_API_KEY not configured")
+            return None
+
+        # Prepare data for prompt
+        topic_counts = trends["_topic_counts"]
+
+        active_repos = [
+            {
+                **repo,
+                "description": safe_get(repo, "description", ""),
+                "topics": safe_get(repo, "topics", []),
+            }
+            for repo in all_data["own_repos"]
+            if safe_get(repo, "is_active")
+        ][: settings.max_active_repos]
+
+        # Fetch blog posts
+        blog_posts = fetch_blog_posts(settings.blog_rss_url, max_posts=5)
+
+        # Fetch resume data for tech stack
+        resume_data = fetch_resume_data(settings.resume_repo_base)
+        skills_section = format_skills_for_prompt(resume_data)
+
+        user_info = all_data["user_info"]
+        activity = all_data["activity"]
+
+        parts: List[str] = [
+            "Você é um especialista em criar perfis GitHub profissionais e envolventes. Analise os dados abaixo e crie um README.md excepcional que conte a história profissional do desenvolvedor de forma autêntica e impactante.",
+            "",
+            "# CONTEXTO COMPLETO DO DESENVOLVEDOR",
+            "",
+            "## INFORMAÇÕES PESSOAIS",
+            f"- Nome: {safe_get(user_info, 'name', settings.github_username)}",
+            f"- Bio atual: {safe_get(user_info, 'bio', 'Não definida')}",
+            f"- Localização: {safe_get(user_info, 'location', 'Não informada')}",
+            f"- Empresa: {safe_get(user_info, 'company', 'Não informada')}",
+            f"- Repositórios públicos: {safe_get(user_info, 'public_repos', 0)}",
+            f"- Seguidores: {safe_get(user_info, 'followers', 0)}",
+            "",
+            '## ÁREAS DE EXPERTISE (OBRIGATÓRIO INCLUIR NO "SOBRE MIM" E "FOCO ATUAL")',
+            self._expertise_bullets,
+            "",
+            f"## ATIVIDADE RECENTE (Últimos {settings.recent_days} dias)",
+            f"- **Commits:** {activity['commits']} commits",
+            f"- **Pull Requests:** {activity['prs_created']} criados, {activity['prs_reviewed']} revisados",
+            f"- **Issues:** {activity['issues_opened']} abertas, {activity['issues_commented']} comentadas",
+            f"- **Repositórios trabalhados:** {len(activity['repos_worked_on'])} repos",
+            f"- **Padrão de atividade:** {trends['activity_pattern']}",
+            "",
+            "## TRABALHO RECENTE EM DETALHES",
+        ]
+
+        recent_commits = activity["recent_commits_detail"][: settings.max_recent_commits]
+        if recent_commits:
+            for commit in recent_commits:
+                parts.append(f"  • {commit['repo']}: {commit['message'][:60]}...")
+        else:
+            parts.append("Nenhum commit recente detectado em repos públicos")
+
+        parts.append("")
+        if activity["repos_contributed"]:
+            parts.append("**Contribuindo para projetos externos:**")
+            for repo in activity["repos_contributed"][:5]:
+                parts.append(f"  • {repo}")
+
+        parts.append("")
+        parts.append("## REPOSITÓRIOS PRÓPRIOS ATIVOS")
+        if active_repos:
+            for r in active_repos:
+                parts.append(
+                    f"- **{r['name']}** [{r['language']}]: {truncate_text(safe_get(r, 'description', 'Sem descrição'), 80)} (⭐ {safe_get(r, 'stars', 0)}, 🍴 {safe_get(r, 'forks', 0)})"
+                )
+        else:
+            parts.append("Sem atividade recente em repositórios próprios")
+
+        recent_stars = all_data["recent_stars"]
+        parts.append("")
+        parts.append(
+            f"## REPOSITÓRIOS COM ESTRELA RECENTES ({len(recent_stars)} nos últimos {settings.recent_days} dias)"
+        )
+        if recent_stars:
+            for r in recent_stars[: settings.max_recent_stars]:
+                parts.append(
+                    f"- **{r['name']}** [{r['language']}]: {truncate_text(safe_get(r, 'description', 'Sem descrição'), 80)}"
+                )
+                parts.append(f"  Tópicos: {r['topics']}")
+        else:
+            parts.append("")
+
+        parts.append("")
+        parts.append("## ANÁLISE DE TENDÊNCIAS")
+        parts.append("")
+        parts.append("### Tópicos Emergentes (foco recente)")
+        if trends["emerging_topics"]:
+            for t in trends["emerging_topics"][:8]:
+                parts.append(
+                    f"- **{t['topic']}**: {t['recent_count']} de {t['total_count']} ocorrências são recentes ({int(t['recent_count'] / t['total_count'] * 100)}%)"
+                )
+        else:
+            parts.append("Nenhum tópico emergente identificado")
+
+        parts.append("")
+        parts.append("### Linguagens em Crescimento")
+        parts.append(
+            ", ".join(trends["growing_languages"])
+            if trends["growing_languages"]
+            else "Nenhuma tendência identificada"
+        )
+        parts.append("")
+        parts.append("### Áreas de Expertise Identificadas")
+        parts.append(
+            ", ".join(trends["expertise_areas"]) if trends["expertise_areas"] else "Analisando..."
+        )
+
+        parts.append("")
+        parts.append("## ESTATÍSTICAS GERAIS")
+        parts.append(f"- **Total de estrelas dadas:** {len(all_data['starred'])} repositórios")
+        parts.append(f"- **Repositórios próprios:** {len(all_data['own_repos'])} (não-forks)")
+        parts.append(f"- **Tópicos únicos explorados:** {len(topic_counts)}")
+        parts.append("")
+        parts.append("### Top 25 Tópicos (ordenado por frequência)")
+        parts.append(", ".join([f"{t} ({c})" for t, c in trends["_top_topics"]]))
+        parts.append("")
+        parts.append("### Top 12 Linguagens")
+        parts.append(", ".join([f"{l} ({c})" for l, c in trends["_top_languages"]]))
+
+        parts.append("")
+        if blog_posts:
+            parts.append("## ÚLTIMOS POSTS DO BLOG")
+            for p in blog_posts:
+                parts.append(f"- [{p['title']}]({p['link']}) - {p['pub_date']}")
+
+        parts.append("")
+        parts.append("---")
+        parts.append("")
+        parts.append(_PROMPT_MISSION)
+        parts.append("")
+        parts.append(skills_section)
+        parts.append("")
+        parts.append(_PROMPT_COLLABORATION)
+        parts.append(f"- GitHub: {settings.github_username}")
+        parts.append(f"- Email: {settings.email}")
+        parts.append(f"- LinkedIn: {settings.linkedin}")
+        parts.append(f"- Twitter/X: {settings.twitter}")
+        parts.append(f"- Website/Blog: {settings.website}")
+        parts.append("")
+        parts.append(_PROMPT_GUIDELINES_HEAD)
+        parts.append(
+            f"4. **ATUALIDADE**: Priorize informações dos últimos {settings.recent_days}-{settings.very_recent_days} dias"
+        )
+        parts.append(_PROMPT_GUIDELINES_TAIL)
+
+        prompt = _NL.join(parts)
+
         try:
             response = self.client.models.generate_content(
                 model=settings.gemini_model,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.7,
-                    top_p=0.9,
-                    top_k=40,
-                ),
+                config=self._gen_config,
             )
             content = response.text
 
             # Clean up
-            content = content.replace("```markdown", "").replace("```", "").strip()
+            content = content.replace("```markdown", "").replace("```", "")
 
             # Split into Portuguese and English versions
-            if "---LANG_SEPARATOR---" in content:
-                parts = content.split("---LANG_SEPARATOR---")
+            pt_content, separator, en_content = content.partition("---LANG_SEPARATOR---")
+            if separator:
                 return {
-                    "pt-br": parts[0].strip(),
-                    "en": parts[1].strip() if len(parts) > 1 else parts[0].strip(),
+                    "pt-br": pt_content.strip(),
+                    "en": en_content.partition("---LANG_SEPARATOR---")[0].strip(),
                 }
             else:
                 # Fallback: return same content for both
+                content = content.strip()
                 return {"pt-br": content, "en": content}
         except Exception as e:
             print(f"⚠ Error using Gemini API: {e}")
@@ -342,21 +355,43 @@ Comece diretamente com o conteúdo do README em português.
     ) -> str:
         """Generate a basic README when AI fails."""
         user_info = all_data["user_info"]
-        username = user_info.get("name", settings.github_username)
-
+        activity = all_data["activity"]
+
+        return self._render_fallback_readme(
+            user_info.get("name", settings.github_username),
+            len(all_data["starred"]),
+            len(all_data["own_repos"]),
+            activity["commits"],
+            activity["prs_created"],
+            activity["prs_reviewed"],
+            tuple(trends["expertise_areas"]),
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _render_fallback_readme(
+        username: str,
+        starred_count: int,
+        own_repos_count: int,
+        commits: int,
+        prs_created: int,
+        prs_reviewed: int,
+        expertise_areas: Tuple[str, ...],
+    ) -> str:
+        """Render the fallback README from the few values it depends on."""
         return f"""# {username}
 
 ## About Me
 
-I'm a developer with {len(all_data["starred"])} starred repositories and {len(all_data["own_repos"])} personal projects.
+I'm a developer with {starred_count} starred repositories and {own_repos_count} personal projects.
 
 ## Recent Activity
 
-- {all_data["activity"]["commits"]} commits in the last {settings.recent_days} days
-- {all_data["activity"]["prs_created"]} pull requests created
-- {all_data["activity"]["prs_reviewed"]} pull requests reviewed
+- {commits} commits in the last {settings.recent_days} days
+- {prs_created} pull requests created
+- {prs_reviewed} pull requests reviewed
 
 ## Technologies
 
-{", ".join(trends["expertise_areas"]) if trends["expertise_areas"] else "Exploring various technologies"}
+{", ".join(expertise_areas) if expertise_areas else "Exploring various technologies"}
 """
@@ -1,14 +1,143 @@
 """GitHub data collection and analysis module."""
 
+import asyncio
+import re
+import time
+from bisect import bisect_right
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
+import aiohttp
+import orjson
 import requests
+import requests_cache
 import tenacity
+from requests.adapters import HTTPAdapter
 
 from .config import settings
-from .utils import is_recent, safe_get
+from .utils import safe_get
+
+
+_GRAPHQL_REPO_FIELDS = """
+fragment RepoFields on Repository {
+  databaseId
+  name
+  nameWithOwner
+  description
+  url
+  primaryLanguage { name }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  stargazerCount
+  forkCount
+  updatedAt
+  hasWikiEnabled
+  hasIssuesEnabled
+  isPrivate
+  isFork
+  diskUsage
+  issues(states: OPEN) { totalCount }
+}
+"""
+
+_GRAPHQL_OWN_REPOS = """
+repositories(first: 100, after: $reposCursor, ownerAffiliations: OWNER, privacy: PUBLIC,
+             orderBy: {field: UPDATED_AT, direction: DESC}) {
+  pageInfo { hasNextPage endCursor }
+  nodes { ...RepoFields }
+}
+"""
+
+_GRAPHQL_STARRED = """
+starredRepositories(first: 100, after: $starredCursor,
+                    orderBy: {field: STARRED_AT, direction: DESC}) {
+  pageInfo { hasNextPage endCursor }
+  edges { starredAt node { ...RepoFields } }
+}
+"""
+
+_GRAPHQL_PROFILE_QUERY = (
+    """
+query($login: String!, $reposCursor: String, $starredCursor: String) {
+  user(login: $login) {
+    login
+    databaseId
+    name
+    bio
+    location
+    company
+    followers { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+"""
+    + _GRAPHQL_OWN_REPOS
+    + _GRAPHQL_STARRED
+    + """
+  }
+}
+"""
+    + _GRAPHQL_REPO_FIELDS
+)
+
+_GRAPHQL_REPOS_PAGE_QUERY = (
+    "query($login: String!, $reposCursor: String) { user(login: $login) {"
+    + _GRAPHQL_OWN_REPOS
+    + "} }"
+    + _GRAPHQL_REPO_FIELDS
+)
+
+_GRAPHQL_STARRED_PAGE_QUERY = (
+    "query($login: String!, $starredCursor: String) { user(login: $login) {"
+    + _GRAPHQL_STARRED
+    + "} }"
+    + _GRAPHQL_REPO_FIELDS
+)
+
+_TECH_KEYWORDS: Dict[str, List[str]] = {
+    "frontend": ["react", "vue", "angular", "svelte", "next.js", "nuxt"],
+    "backend": ["django", "flask", "fastapi", "express", "nest.js", "spring"],
+    "mobile": ["react native", "flutter", "swift", "kotlin", "ionic"],
+    "devops": ["docker", "kubernetes", "k8s", "terraform", "ansible", "ci/cd"],
+    "data": ["pandas", "numpy", "tensorflow", "pytorch", "spark", "airflow"],
+    "cloud": ["aws", "azure", "gcp", "cloud", "serverless", "lambda"],
+}
+
+# One alternation per category so each description is scanned once per
+# category instead of once per keyword
+_TECH_KEYWORD_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in _TECH_KEYWORDS.items()
+]
+
+
+# Longest pause for an exhausted rate-limit budget; unauthenticated budgets
+# reset hourly, so longer waits fail fast instead of looking like a hang
+_MAX_RATE_LIMIT_WAIT = 60.0
+
+
+@dataclass
+class _RateLimitState:
+    """Rate-limit budget last reported by the GitHub API response headers."""
+
+    limit: int = 5000
+    remaining: int = 5000
+    reset_at: float = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Refresh the budget from X-RateLimit-* response headers."""
+        if "X-RateLimit-Limit" in headers:
+            self.limit = int(headers["X-RateLimit-Limit"])
+        if "X-RateLimit-Remaining" in headers:
+            self.remaining = int(headers["X-RateLimit-Remaining"])
+        if "X-RateLimit-Reset" in headers:
+            self.reset_at = float(headers["X-RateLimit-Reset"])
+
+    def wait_time(self) -> float:
+        """Seconds until the budget resets, or 0 while requests are left."""
+        if self.remaining > 0:
+            return 0.0
+        return max(0.0, self.reset_at - time.time())
 
 
 class GitHubAnalyzer:
@@ -16,7 +145,21 @@ class GitHubAnalyzer:
 
     def __init__(self, token: Optional[str] = None):
         self.token = token
-        self.session = requests.Session()
+        # GET responses made through this session (user info, events) are
+        # cached on disk with per-resource TTLs; once expired, requests-cache
+        # revalidates with If-None-Match so unchanged data comes back as a 304.
+        # Starred/own repo pages are fetched with aiohttp and are not cached.
+        # This only pays off for repeat runs on the same machine.
+        api_base = settings.github_api_base
+        self.session = requests_cache.CachedSession(
+            cache_name=settings.github_cache_name,
+            backend="sqlite",
+            expire_after=300,
+            urls_expire_after={
+                f"{api_base}/users/*/events": 300,
+                f"{api_base}/users/*": 3600,
+            },
+        )
         self.session.headers.update(
             {
                 "Accept": "application/vnd.github.v3+json",
@@ -25,6 +168,53 @@ class GitHubAnalyzer:
         )
         if token:
             self.session.headers["Authorization"] = f"token {token}"
+        # All requests go to a single host; keep enough pooled connections for
+        # the concurrent fetches so TLS handshakes are reused across the run.
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+        # GitHub budgets REST ("core") and GraphQL points separately, so the
+        # state is tracked per X-RateLimit-Resource
+        self._rate_limits: Dict[str, _RateLimitState] = {
+            "core": _RateLimitState(),
+            "graphql": _RateLimitState(),
+        }
+        self._event_handlers: Dict[str, Callable[..., None]] = {
+            "PushEvent": self._handle_push_event,
+            "PullRequestEvent": self._handle_pull_request_event,
+            "PullRequestReviewEvent": self._handle_pull_request_review_event,
+            "IssuesEvent": self._handle_issues_event,
+            "IssueCommentEvent": self._handle_issue_comment_event,
+        }
+
+    def _rate_limit_delay(self, resource: str = "core") -> float:
+        """Return how long to pause before the next request, announcing any wait.
+
+        Only an exhausted budget causes a pause, and only when it resets
+        within _MAX_RATE_LIMIT_WAIT; otherwise the request goes ahead and
+        fails with the usual rate-limit error.
+
+        Args:
+            resource: Rate-limit resource the request draws from ("core" or "graphql").
+        """
+        delay = self._rate_limits[resource].wait_time()
+        if not delay:
+            return 0.0
+        if delay > _MAX_RATE_LIMIT_WAIT:
+            print(f"⚠ GitHub {resource} rate limit exhausted, resets in {delay:.0f}s; not waiting")
+            return 0.0
+        print(f"⏳ GitHub {resource} rate limit exhausted, waiting {delay:.0f}s for reset...")
+        return delay
+
+    def _update_rate_limit(self, headers: Mapping[str, str], resource: str = "core") -> None:
+        """Record the budget reported by a response.
+
+        The X-RateLimit-Resource header, when present, decides which budget
+        is updated; ``resource`` is the fallback.
+        """
+        resource = headers.get("X-RateLimit-Resource", resource)
+        state = self._rate_limits.get(resource)
+        if state is None:
+            state = self._rate_limits.setdefault(resource, _RateLimitState())
+        state.update(headers)
 
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(3),
@@ -34,12 +224,19 @@ class GitHubAnalyzer:
     )
     def _make_request(self, url: str, headers: Optional[Dict[str, Any]] = None) -> Any:
         """Make a request with retry logic."""
+        delay = self._rate_limit_delay()
+        if delay:
+            time.sleep(delay)
+
         try:
             response = self.session.get(
                 url, headers=headers or self.get_headers(), timeout=30
             )
+            if not getattr(response, "from_cache", False):
+                self._update_rate_limit(response.headers)
+                self._honor_poll_interval(response)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 raise Exception(
@@ -49,6 +246,127 @@ class GitHubAnalyzer:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error: {e}") from e
 
+    def _honor_poll_interval(self, response: requests.Response) -> None:
+        """Keep a fresh response cached for at least its X-Poll-Interval.
+
+        The events API sends this header to ask clients not to poll more
+        often; when GitHub raises it above the configured events TTL the
+        cached entry is extended so later runs reuse it instead of polling.
+        ETag revalidation once it does expire is handled by requests-cache.
+        Responses requests-cache chose not to store (no ``expires``) are left
+        alone so this never overrides its skip decision.
+        """
+        poll_interval = response.headers.get("X-Poll-Interval", "")
+        if not poll_interval.isdigit() or not response.ok:
+            return
+
+        poll_expires = datetime.now(timezone.utc) + timedelta(seconds=int(poll_interval))
+        expires = getattr(response, "expires", None)
+        if expires is None or expires >= poll_expires:
+            return
+        self.session.cache.save_response(response, expires=poll_expires)
+
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(3),
+        wait=tenacity.wait_exponential(multiplier=1, min=4, max=10),
+        retry=tenacity.retry_if_exception_type(aiohttp.ClientError),
+        reraise=True,
+    )
+    async def _make_request_async(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Tuple[Any, int]:
+        """Async twin of _make_request that also returns the last page number."""
+        delay = self._rate_limit_delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+        try:
+            async with session.get(url) as response:
+                self._update_rate_limit(response.headers)
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+                return data, self._last_page(response.headers.get("Link"))
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
+                raise Exception(
+                    "Rate limit exceeded. Please check your token or wait."
+                ) from e
+            raise
+
+    @staticmethod
+    def _last_page(link_header: Optional[str]) -> int:
+        """Extract the page number of the rel="last" link, defaulting to 1."""
+        if not link_header:
+            return 1
+        for link in requests.utils.parse_header_links(link_header):
+            if link.get("rel") == "last":
+                pages = parse_qs(urlparse(link["url"]).query).get("page")
+                if pages:
+                    return int(pages[0])
+        return 1
+
+    async def _paginate_async(
+        self, url_template: str, headers: Dict[str, Any], label: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch every page of a paginated endpoint concurrently.
+
+        The first page is fetched alone to learn the last page number from the
+        Link header; the remaining pages are then requested concurrently. On
+        error, the items from the pages before the failing one are returned.
+
+        Args:
+            url_template: Endpoint URL with a ``{page}`` placeholder.
+            headers: Request headers.
+            label: Human readable name used in error messages.
+
+        Returns:
+            Concatenated items of all pages, in page order.
+        """
+        items: List[Dict[str, Any]] = []
+        semaphore = asyncio.Semaphore(8)
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        # aiohttp connectors are bound to the event loop that created them, so
+        # one pooled connector is shared by all pages of this pagination run.
+        connector = aiohttp.TCPConnector(
+            limit=64, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=75
+        )
+
+        async with aiohttp.ClientSession(
+            connector=connector, headers=headers, timeout=timeout
+        ) as session:
+            try:
+                first_page, last_page = await self._make_request_async(
+                    session, url_template.format(page=1)
+                )
+            except Exception as e:
+                print(f"⚠ Error fetching {label}: {e}")
+                return items
+
+            if not first_page:
+                return items
+            items.extend(first_page)
+
+            async def fetch_page(page: int) -> Any:
+                async with semaphore:
+                    data, _ = await self._make_request_async(
+                        session, url_template.format(page=page)
+                    )
+                    return data
+
+            pages = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, last_page + 1)),
+                return_exceptions=True,
+            )
+
+        for page_data in pages:
+            if isinstance(page_data, Exception):
+                print(f"⚠ Error fetching {label}: {page_data}")
+                break
+            items.extend(page_data)
+
+        return items
+
     def get_headers(self, star_header: bool = False) -> Dict[str, Any]:
         """Get appropriate headers for API requests."""
         headers = dict(self.session.headers)
@@ -58,47 +376,15 @@ class GitHubAnalyzer:
 
     def get_starred_repos(self, username: str) -> List[Dict[str, Any]]:
         """Fetch starred repositories with pagination."""
-        repos = []
-        page = 1
-
-        try:
-            while True:
-                url = f"{settings.github_api_base}/users/{username}/starred?page={page}&per_page=100"
-                data = self._make_request(
-                    url, headers=self.get_headers(star_header=True)
-                )
-
-                if not data:
-                    break
-
-                repos.extend(data)
-                page += 1
-        except Exception as e:
-            print(f"⚠ Error fetching starred repos: {e}")
-            return repos
-
-        return repos
+        url = f"{settings.github_api_base}/users/{username}/starred?page={{page}}&per_page=100"
+        return asyncio.run(
+            self._paginate_async(url, self.get_headers(star_header=True), "starred repos")
+        )
 
     def get_user_repos(self, username: str) -> List[Dict[str, Any]]:
         """Fetch user repositories with pagination."""
-        repos = []
-        page = 1
-
-        try:
-            while True:
-                url = f"{settings.github_api_base}/users/{username}/repos?page={page}&per_page=100&sort=updated"
-                data = self._make_request(url, headers=self.get_headers())
-
-                if not data:
-                    break
-
-                repos.extend(data)
-                page += 1
-        except Exception as e:
-            print(f"⚠ Error fetching user repos: {e}")
-            return repos
-
-        return repos
+        url = f"{settings.github_api_base}/users/{username}/repos?page={{page}}&per_page=100&sort=updated"
+        return asyncio.run(self._paginate_async(url, self.get_headers(), "user repos"))
 
     def get_user_info(self, username: str) -> Dict[str, Any]:
         """Fetch user profile information."""
@@ -109,6 +395,121 @@ class GitHubAnalyzer:
             print(f"⚠ Error fetching user info: {e}")
             return {}
 
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query and return its ``data`` payload."""
+        delay = self._rate_limit_delay("graphql")
+        if delay:
+            time.sleep(delay)
+
+        response = self.session.post(
+            f"{settings.github_api_base}/graphql",
+            json={"query": query, "variables": variables},
+            timeout=30,
+        )
+        self._update_rate_limit(response.headers, "graphql")
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        if payload.get("errors"):
+            raise Exception(payload["errors"][0].get("message", "GraphQL error"))
+        return payload["data"]
+
+    @staticmethod
+    def _repo_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL repository node onto the REST repository shape."""
+        return {
+            "id": node["databaseId"],
+            "name": node["name"],
+            "full_name": node["nameWithOwner"],
+            "description": node["description"],
+            "html_url": node["url"],
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+            "stargazers_count": node["stargazerCount"],
+            "forks_count": node["forkCount"],
+            "updated_at": node["updatedAt"],
+            "has_wiki": node["hasWikiEnabled"],
+            "has_pages": False,  # not exposed by the GraphQL API
+            "private": node["isPrivate"],
+            "fork": node["isFork"],
+            "size": node["diskUsage"] or 0,
+            "has_issues": node["hasIssuesEnabled"],
+            "open_issues_count": node["issues"]["totalCount"],
+        }
+
+    @classmethod
+    def _starred_from_graphql(cls, edges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Map starredRepositories edges onto the REST starred shape.
+
+        With a user token GraphQL also lists private repos the user starred,
+        which /users/{u}/starred never returns; those are dropped so nothing
+        private ends up in the prompt or the public README.
+        """
+        return [
+            {"starred_at": e["starredAt"], "repo": cls._repo_from_graphql(e["node"])}
+            for e in edges
+            if not e["node"]["isPrivate"]
+        ]
+
+    def fetch_profile_bundle(
+        self, username: str
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Fetch user info, starred repos and own repos through GraphQL.
+
+        The first 100 starred and own repos come back with the profile in a
+        single query; further pages are followed by cursor. Results use the
+        same shapes as get_user_info, get_starred_repos and get_user_repos.
+        Recent events have no GraphQL equivalent and are still fetched via
+        get_recent_activity.
+
+        Args:
+            username: GitHub username.
+
+        Returns:
+            Tuple of (user info, starred repos, own repos), or None if the
+            GraphQL API is unavailable (no token, missing scopes, errors) so
+            the caller can fall back to REST.
+        """
+        if not self.token:
+            return None
+
+        try:
+            user = self._graphql(_GRAPHQL_PROFILE_QUERY, {"login": username})["user"]
+            if user is None:
+                return None
+
+            repos_conn = user["repositories"]
+            user_repos = [self._repo_from_graphql(n) for n in repos_conn["nodes"]]
+            while repos_conn["pageInfo"]["hasNextPage"]:
+                repos_conn = self._graphql(
+                    _GRAPHQL_REPOS_PAGE_QUERY,
+                    {"login": username, "reposCursor": repos_conn["pageInfo"]["endCursor"]},
+                )["user"]["repositories"]
+                user_repos.extend(self._repo_from_graphql(n) for n in repos_conn["nodes"])
+
+            starred_conn = user["starredRepositories"]
+            starred_repos = self._starred_from_graphql(starred_conn["edges"])
+            while starred_conn["pageInfo"]["hasNextPage"]:
+                starred_conn = self._graphql(
+                    _GRAPHQL_STARRED_PAGE_QUERY,
+                    {"login": username, "starredCursor": starred_conn["pageInfo"]["endCursor"]},
+                )["user"]["starredRepositories"]
+                starred_repos.extend(self._starred_from_graphql(starred_conn["edges"]))
+        except Exception as e:
+            print(f"⚠ GraphQL fetch failed, falling back to REST: {e}")
+            return None
+
+        user_info = {
+            "login": user["login"],
+            "id": user["databaseId"],
+            "name": user["name"],
+            "bio": user["bio"],
+            "location": user["location"],
+            "company": user["company"],
+            "public_repos": user["publicRepos"]["totalCount"],
+            "followers": user["followers"]["totalCount"],
+        }
+        return user_info, starred_repos, user_repos
+
     def get_recent_activity(self, username: str) -> List[Dict[str, Any]]:
         """Fetch recent user activity."""
         try:
@@ -128,103 +529,213 @@ class GitHubAnalyzer:
             "prs_reviewed": 0,
             "issues_opened": 0,
             "issues_commented": 0,
-            "repos_worked_on": set(),
-            "repos_contributed": set(),
+            # Dicts used as insertion-ordered sets
+            "repos_worked_on": {},
+            "repos_contributed": {},
             "recent_commits_detail": [],
-            "collaboration_repos": set(),
+            "collaboration_repos": {},
         }
 
-        thirty_days_ago = datetime.now() - timedelta(days=settings.recent_days)
+        cutoff_ts = time.time() - settings.recent_days * 86400
 
         # Extract just the repo names (without owner) from own repos
         own_repo_names_only = {name.split("/")[-1] for name in own_repos_names}
 
-        def is_fork_of_own_repo(repo_full_name: str) -> bool:
-            """Check if a repo is likely a fork of one of our own repos."""
-            repo_name_only = repo_full_name.split("/")[-1]
-            return repo_name_only in own_repo_names_only
-
+        handlers = self._event_handlers
         for event in events:
+            handler = handlers.get(event["type"])
+            if handler is None:
+                continue
+
+            created_at = event["created_at"]
             try:
-                event_date = datetime.strptime(
-                    event["created_at"], "%Y-%m-%dT%H:%M:%SZ"
+                # GitHub timestamps are UTC with a trailing "Z"
+                event_ts = (
+                    datetime.fromisoformat(created_at[:-1])
+                    .replace(tzinfo=timezone.utc)
+                    .timestamp()
                 )
             except ValueError:
                 continue
 
-            if event_date < thirty_days_ago:
+            if event_ts < cutoff_ts:
                 continue
 
-            event_type = event["type"]
             repo_name = event["repo"]["name"]
             is_own_repo = repo_name in own_repos_names
-            is_fork_of_own = is_fork_of_own_repo(repo_name)
-
-            if event_type == "PushEvent":
-                commits = safe_get(event, "payload", {}).get("commits", [])
-                activity_summary["commits"] += len(commits)
-                activity_summary["repos_worked_on"].add(repo_name)
-
-                if is_own_repo:
-                    for commit in commits[: settings.max_recent_commits]:
-                        activity_summary["recent_commits_detail"].append(
-                            {
-                                "repo": repo_name,
-                                "message": safe_get(commit, "message", ""),
-                                "date": event_date.strftime("%Y-%m-%d"),
-                            }
-                        )
-                elif not is_fork_of_own:
-                    # Only count as contribution if not a fork of own repo
-                    activity_summary["repos_contributed"].add(repo_name)
-
-            elif event_type == "PullRequestEvent":
-                activity_summary["prs_created"] += 1
-                if not is_own_repo and not is_fork_of_own:
-                    activity_summary["collaboration_repos"].add(repo_name)
-
-            elif event_type == "PullRequestReviewEvent":
-                activity_summary["prs_reviewed"] += 1
-
-            elif event_type == "IssuesEvent":
-                if safe_get(event, "payload", {}).get("action") == "opened":
-                    activity_summary["issues_opened"] += 1
-
-            elif event_type == "IssueCommentEvent":
-                activity_summary["issues_commented"] += 1
-
-        # Convert sets to lists
-        activity_summary["repos_worked_on"] = list(activity_summary["repos_worked_on"])
-        activity_summary["repos_contributed"] = list(
-            activity_summary["repos_contributed"]
-        )
-        activity_summary["collaboration_repos"] = list(
-            activity_summary["collaboration_repos"]
-        )
+            # A repo sharing a name with one of ours is likely a fork of it
+            is_fork_of_own = repo_name.split("/")[-1] in own_repo_names_only
+            handler(event, activity_summary, repo_name, is_own_repo, is_fork_of_own)
+
+        # Convert ordered sets to lists
+        for key in ("repos_worked_on", "repos_contributed", "collaboration_repos"):
+            activity_summary[key] = list(activity_summary[key])
 
         return activity_summary
 
-    def extract_repo_insights(self, repo: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract insights from a repository."""
-        description = safe_get(repo, "description", "") or ""
-        tech_keywords = {
-            "frontend": ["react", "vue", "angular", "svelte", "next.js", "nuxt"],
-            "backend": ["django", "flask", "fastapi", "express", "nest.js", "spring"],
-            "mobile": ["react native", "flutter", "swift", "kotlin", "ionic"],
-            "devops": ["docker", "kubernetes", "k8s", "terraform", "ansible", "ci/cd"],
-            "data": ["pandas", "numpy", "tensorflow", "pytorch", "spark", "airflow"],
-            "cloud": ["aws", "azure", "gcp", "cloud", "serverless", "lambda"],
-        }
+    def _handle_push_event(
+        self,
+        event: Dict[str, Any],
+        summary: Dict[str, Any],
+        repo_name: str,
+        is_own_repo: bool,
+        is_fork_of_own: bool,
+    ) -> None:
+        """Count pushed commits and record details for own repos."""
+        commits = (event.get("payload") or {}).get("commits") or []
+        summary["commits"] += len(commits)
+        summary["repos_worked_on"][repo_name] = None
+
+        if is_own_repo:
+            date = event["created_at"][:10]
+            for commit in commits[: settings.max_recent_commits]:
+                summary["recent_commits_detail"].append(
+                    {
+                        "repo": repo_name,
+                        "message": commit.get("message") or "",
+                        "date": date,
+                    }
+                )
+        elif not is_fork_of_own:
+            # Only count as contribution if not a fork of own repo
+            summary["repos_contributed"][repo_name] = None
+
+    def _handle_pull_request_event(
+        self,
+        event: Dict[str, Any],
+        summary: Dict[str, Any],
+        repo_name: str,
+        is_own_repo: bool,
+        is_fork_of_own: bool,
+    ) -> None:
+        """Count created PRs and track external collaboration."""
+        summary["prs_created"] += 1
+        if not is_own_repo and not is_fork_of_own:
+            summary["collaboration_repos"][repo_name] = None
+
+    def _handle_pull_request_review_event(
+        self,
+        event: Dict[str, Any],
+        summary: Dict[str, Any],
+        repo_name: str,
+        is_own_repo: bool,
+        is_fork_of_own: bool,
+    ) -> None:
+        """Count PR reviews."""
+        summary["prs_reviewed"] += 1
+
+    def _handle_issues_event(
+        self,
+        event: Dict[str, Any],
+        summary: Dict[str, Any],
+        repo_name: str,
+        is_own_repo: bool,
+        is_fork_of_own: bool,
+    ) -> None:
+        """Count opened issues."""
+        if (event.get("payload") or {}).get("action") == "opened":
+            summary["issues_opened"] += 1
+
+    def _handle_issue_comment_event(
+        self,
+        event: Dict[str, Any],
+        summary: Dict[str, Any],
+        repo_name: str,
+        is_own_repo: bool,
+        is_fork_of_own: bool,
+    ) -> None:
+        """Count issue comments."""
+        summary["issues_commented"] += 1
+
+    def analyze_repos(self, repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract insights for a batch of repositories.
+
+        Keyword categories are matched over all descriptions at once rather
+        than repo by repo, see _categorize_descriptions.
+
+        Args:
+            repos: Repository dicts as returned by the GitHub API.
+
+        Returns:
+            List of insight dicts, in the same order as ``repos``.
+        """
+        cutoff_iso = (datetime.now() - timedelta(days=180)).isoformat()
+        categories = self._categorize_descriptions(
+            [(safe_get(repo, "description", "") or "").lower() for repo in repos]
+        )
+        return [
+            {
+                "categories": repo_categories,
+                "has_docs": bool(safe_get(repo, "has_wiki") or safe_get(repo, "has_pages")),
+                "is_maintained": safe_get(repo, "updated_at", "") > cutoff_iso,
+            }
+            for repo, repo_categories in zip(repos, categories)
+        ]
+
+    @staticmethod
+    def _categorize_descriptions(descriptions: List[str]) -> List[List[str]]:
+        """Match tech keyword categories against many lowercased descriptions.
+
+        The descriptions are joined with newlines (no keyword contains one,
+        so a match never spans two repos) and each category's pattern is
+        searched over the joined text, jumping to the next description after
+        every hit. That is one regex scan per category for the whole batch.
+
+        Args:
+            descriptions: Lowercased repository descriptions.
+
+        Returns:
+            Matched categories for each description, in _TECH_KEYWORDS order.
+        """
+        matched: List[List[str]] = [[] for _ in descriptions]
+        if not descriptions:
+            return matched
+
+        text = "\n".join(descriptions)
+        starts = []
+        offset = 0
+        for description in descriptions:
+            starts.append(offset)
+            offset += len(description) + 1
+
+        for category, pattern in _TECH_KEYWORD_PATTERNS:
+            search = pattern.search
+            match = search(text)
+            while match:
+                index = bisect_right(starts, match.start()) - 1
+                matched[index].append(category)
+                if index + 1 == len(starts):
+                    break
+                match = search(text, starts[index + 1])
+
+        return matched
+
+    def extract_repo_insights(
+        self, repo: Dict[str, Any], cutoff_iso: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Extract insights from a repository.
+
+        Args:
+            repo: Repository dict as returned by the GitHub API.
+            cutoff_iso: ISO timestamp a repo must have been updated after to
+                count as maintained. Computed from the current time if omitted.
 
-        identified_categories = []
+        Returns:
+            Dictionary with the repo's categories, docs and maintenance flags.
+        """
+        if cutoff_iso is None:
+            cutoff_iso = (datetime.now() - timedelta(days=180)).isoformat()
+
+        description = safe_get(repo, "description", "") or ""
         desc_lower = description.lower()
-        for category, keywords in tech_keywords.items():
-            if any(keyword in desc_lower for keyword in keywords):
-                identified_categories.append(category)
+        identified_categories = [
+            category
+            for category, pattern in _TECH_KEYWORD_PATTERNS
+            if pattern.search(desc_lower)
+        ]
 
         return {
             "categories": identified_categories,
             "has_docs": bool(safe_get(repo, "has_wiki") or safe_get(repo, "has_pages")),
-            "is_maintained": safe_get(repo, "updated_at", "")
-            > (datetime.now() - timedelta(days=180)).isoformat(),
+            "is_maintained": safe_get(repo, "updated_at", "") > cutoff_iso,
         }
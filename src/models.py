@@ -1,6 +1,10 @@
-"""Pydantic models for data validation."""
+"""Pydantic models for data validation.
+
+These describe the shape of the GitHub payloads and analysis results. The
+pipeline itself passes plain dicts around and never instantiates them per
+repo or per event.
+"""
 
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -107,9 +111,8 @@ class AnalysisData(BaseModel):
     own_repos: List[Dict[str, Any]] = Field(default_factory=list)
     activity: ActivitySummary
     user_info: Dict[str, Any] = Field(default_factory=dict)
-    all_topics: List[str] = Field(default_factory=list)
+    all_topics_counter: Dict[str, int] = Field(default_factory=dict)
     all_languages: List[str] = Field(default_factory=list)
     recent_stars: List[Dict[str, Any]] = Field(default_factory=list)
-    topic_timeline: Dict[str, List[Any]] = Field(default_factory=dict)
     language_evolution: Dict[str, int] = Field(default_factory=dict)
     repo_categories: Dict[str, int] = Field(default_factory=dict)
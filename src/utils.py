@@ -1,12 +1,194 @@
 """Utility functions for the GitHub analysis tool."""
 
+import calendar
 import os
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from io import BytesIO
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+import orjson
 import requests
+import requests_cache
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .config import settings
+
+try:
+    # libxml2-backed parser when lxml happens to be installed; entity
+    # expansion and network access stay disabled for remote feeds
+    from lxml.etree import iterparse as _xml_iterparse
+
+    _XML_PARSE_OPTIONS: Dict[str, Any] = {"resolve_entities": False, "no_network": True}
+except ImportError:
+    from xml.etree.ElementTree import iterparse as _xml_iterparse
+
+    _XML_PARSE_OPTIONS = {}
+
+T = TypeVar("T")
+
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$", re.ASCII)
+
+# LibYAML-backed loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Badge colors for common technologies, attached to fetched resume data.
+# Read-only so every resume dict can share it without a defensive copy.
+_BADGE_COLORS: Mapping[str, str] = MappingProxyType({
+    # Languages
+    "go": "00ADD8", "python": "3776AB", "shell": "121011", "bash": "121011",
+    "typescript": "3178C6", "rust": "000000", "lua": "2C2D72",
+    # Cloud
+    "aws": "232F3E", "azure": "0078D4", "gcp": "4285F4",
+    # Containers & Orchestration
+    "kubernetes": "326CE5", "docker": "2496ED", "helm": "0F1689",
+    "kustomize": "326CE5", "podman": "892CA0",
+    # CI/CD & GitOps
+    "argocd": "EF7B4D", "github actions": "2088FF", "gitlab ci": "FC6D26",
+    "tekton": "FD495C", "jenkins": "D24939",
+    # IaC
+    "terraform": "7B42BC", "ansible": "EE0000", "pulumi": "8A3391",
+    "crossplane": "326CE5",
+    # Observability
+    "prometheus": "E6522C", "grafana": "F46800", "opentelemetry": "000000",
+    "jaeger": "66CFE3",
+    # DevSecOps
+    "sonarqube": "4E9BCD", "snyk": "4C4A73", "trivy": "1904DA",
+    "opa": "7D9199", "gatekeeper": "7D9199",
+    # Service Mesh
+    "istio": "466BB0", "linkerd": "2BEDA7", "envoy": "AC6199", "cilium": "F8C517",
+    # Databases & Messaging
+    "postgresql": "4169E1", "redis": "DC382D", "mongodb": "47A248",
+    "kafka": "231F20", "rabbitmq": "FF6600",
+})
+
+# Returned (as a copy) when the resume files cannot be fetched
+_EMPTY_RESUME: Mapping[str, Any] = MappingProxyType({"skills": {}, "certifications": []})
+
+# Technologies with valid shields.io logos (logo parameter works)
+# Format: "display_name": ("logo_name", "hex_color")
+_VALID_BADGES: Dict[str, Tuple[str, str]] = {
+    # Languages
+    "Go": ("go", "00ADD8"),
+    "Python": ("python", "3776AB"),
+    "Shell": ("gnubash", "121011"),
+    "Bash": ("gnubash", "121011"),
+    "TypeScript": ("typescript", "3178C6"),
+    "Rust": ("rust", "000000"),
+    "Lua": ("lua", "2C2D72"),
+    # Cloud
+    "AWS": ("amazonwebservices", "232F3E"),
+    "Azure": ("microsoftazure", "0078D4"),
+    "GCP": ("googlecloud", "4285F4"),
+    # Containers & Orchestration
+    "Kubernetes": ("kubernetes", "326CE5"),
+    "Docker": ("docker", "2496ED"),
+    "Helm": ("helm", "0F1689"),
+    "Podman": ("podman", "892CA0"),
+    # CI/CD & GitOps
+    "ArgoCD": ("argo", "EF7B4D"),
+    "GitHub Actions": ("githubactions", "2088FF"),
+    "GitLab CI": ("gitlab", "FC6D26"),
+    "Tekton": ("tekton", "FD495C"),
+    "Jenkins": ("jenkins", "D24939"),
+    # IaC
+    "Terraform": ("terraform", "7B42BC"),
+    "Ansible": ("ansible", "EE0000"),
+    "Pulumi": ("pulumi", "8A3391"),
+    "Crossplane": ("crossplane", "326CE5"),
+    # Observability
+    "Prometheus": ("prometheus", "E6522C"),
+    "Grafana": ("grafana", "F46800"),
+    "OpenTelemetry": ("opentelemetry", "000000"),
+    "Jaeger": ("jaeger", "66CFE3"),
+    # DevSecOps
+    "SonarQube": ("sonarqube", "4E9BCD"),
+    "Snyk": ("snyk", "4C4A73"),
+    "Trivy": ("trivy", "1904DA"),
+    # Service Mesh
+    "Istio": ("istio", "466BB0"),
+    "Envoy": ("envoyproxy", "AC6199"),
+    "Cilium": ("cilium", "F8C517"),
+    # Databases & Messaging
+    "PostgreSQL": ("postgresql", "4169E1"),
+    "Redis": ("redis", "DC382D"),
+    "MongoDB": ("mongodb", "47A248"),
+    "Apache Kafka": ("apachekafka", "231F20"),
+    "RabbitMQ": ("rabbitmq", "FF6600"),
+    # Other tools
+    "Git": ("git", "F05032"),
+    "Linux": ("linux", "FCC624"),
+    "Nginx": ("nginx", "009639"),
+    "HashiCorp Vault": ("vault", "000000"),
+}
+
+# Rendered shields.io badge for each technology in _VALID_BADGES
+_BADGE_MARKDOWN: Dict[str, str] = {
+    tech: (
+        f"![{tech}](https://img.shields.io/badge/{tech.replace(' ', '_')}-{color}"
+        f"?style=for-the-badge&logo={logo}&logoColor=white)"
+    )
+    for tech, (logo, color) in _VALID_BADGES.items()
+}
+
+# Technologies grouped by the category headings used in the prompt
+_CATEGORY_MAPPING: Dict[str, List[str]] = {
+    "Linguagens de Programação": ["Go", "Python", "Shell", "TypeScript", "Rust", "Lua"],
+    "Cloud & FinOps": ["AWS", "Azure", "GCP"],
+    "Orquestração de Containers": ["Kubernetes", "Docker", "Helm", "Podman"],
+    "CI/CD & GitOps": ["ArgoCD", "GitHub Actions", "GitLab CI", "Tekton", "Jenkins"],
+    "Infraestrutura como Código": ["Terraform", "Ansible", "Pulumi", "Crossplane"],
+    "Observabilidade": ["Prometheus", "Grafana", "OpenTelemetry", "Jaeger"],
+    "DevSecOps": ["SonarQube", "Snyk", "Trivy"],
+    "Service Mesh & Redes": ["Istio", "Envoy", "Cilium"],
+    "Bancos de Dados & Message Brokers": ["PostgreSQL", "Redis", "MongoDB", "Apache Kafka", "RabbitMQ"],
+}
+
+# The badge reference section of the prompt only depends on the tables
+# above, so it is rendered once at import
+_BADGE_PROMPT_BLOCK = (
+    "**REGRA IMPORTANTE**: Use badges APENAS para tecnologias listadas abaixo.\n"
+    "NÃO misture badges com texto. Se a tecnologia não tem badge, NÃO a inclua.\n"
+) + "".join(
+    f"\n### {category}\n\n"
+    + " ".join(_BADGE_MARKDOWN[tech] for tech in techs if tech in _BADGE_MARKDOWN)
+    + "\n"
+    for category, techs in _CATEGORY_MAPPING.items()
+)
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Memoize a function's results in-process for a limited time.
+
+    Falsy results (used by the fetch helpers to signal a failed request) are
+    not cached, so a transient error is retried on the next call.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        cache: Dict[Tuple[Any, ...], Tuple[float, T]] = {}
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < seconds:
+                return hit[1]
+            result = func(*args, **kwargs)
+            if result:
+                cache[key] = (time.monotonic(), result)
+            return result
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
 
 
 def setup_directories(dir_path: str) -> None:
@@ -19,28 +201,77 @@ def get_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
-def is_recent(date_str: str, days: int = 30) -> bool:
-    """Check if a date string is within the last N days."""
+def github_timestamps_to_epochs(date_strs: Iterable[str]) -> List[int]:
+    """Convert GitHub API timestamps to UTC epoch seconds in a single pass.
+
+    GitHub always emits the fixed, zero-padded ``YYYY-MM-DDTHH:MM:SSZ``
+    layout, so the fields are sliced positionally instead of going through
+    ``strptime``, and no intermediate ``datetime`` objects are built. Bulk
+    inputs (e.g. thousands of starred repos) can then be compared against
+    integer cutoffs.
+    """
+    _timegm = calendar.timegm
+    return [
+        _timegm(
+            (
+                int(s[0:4]),
+                int(s[5:7]),
+                int(s[8:10]),
+                int(s[11:13]),
+                int(s[14:16]),
+                int(s[17:19]),
+            )
+        )
+        for s in date_strs
+    ]
+
+
+def is_recent(date_str: str, days: int = 30, cutoff: Optional[float] = None) -> bool:
+    """Check if a date string is within the last N days.
+
+    Args:
+        date_str: GitHub timestamp such as ``2024-01-31T12:00:00Z``, or any
+            ISO-8601 timestamp with an explicit UTC offset.
+        days: Size of the window in days.
+        cutoff: Precomputed epoch cutoff. Callers checking many dates can
+            compute ``time.time() - days * 86400`` once and pass it here.
+
+    Returns:
+        True if the timestamp is newer than the cutoff, False otherwise or
+        if it cannot be parsed.
+    """
+    if cutoff is None:
+        cutoff = time.time() - days * 86400
     try:
-        date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-        return date > datetime.now() - timedelta(days=days)
+        if date_str.endswith("Z"):
+            # GitHub's own format: slice off the "Z" and pin the result to UTC
+            date = datetime.fromisoformat(date_str[:-1]).replace(tzinfo=timezone.utc)
+        else:
+            # Explicit offsets (e.g. +00:00) are honored; naive times are rejected
+            date = datetime.fromisoformat(date_str)
+            if date.tzinfo is None:
+                return False
     except ValueError:
         return False
+    return date.timestamp() > cutoff
 
 
 def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
     """Safely get a value from a dictionary."""
-    if not isinstance(data, dict):
+    try:
+        value = data.get(key)
+    except AttributeError:
+        # Not a mapping (e.g. None from a failed request)
         return default
-    value = data.get(key)
-    return value if value is not None else default
+    return default if value is None else value
 
 
 def validate_github_username(username: str) -> bool:
     """Validate GitHub username format."""
-    import re
-
-    return bool(re.match(r"^[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$", username))
+    # Cheap reject for non-strings and out-of-range lengths before the regex
+    if not isinstance(username, str) or not 1 <= len(username) <= 39:
+        return False
+    return _USERNAME_RE.match(username) is not None
 
 
 def format_topics(topics: Optional[List[str]]) -> str:
@@ -48,39 +279,80 @@ def format_topics(topics: Optional[List[str]]) -> str:
     return "|".join(topics) if topics else ""
 
 
+def format_topics_bulk(topic_lists: Iterable[Optional[List[str]]]) -> List[str]:
+    """Format many topic lists at once, same output as ``format_topics``."""
+    _join = "|".join
+    return [_join(topics) if topics else "" for topics in topic_lists]
+
+
 def truncate_text(text: Optional[str], max_length: int = 80) -> str:
     """Truncate text to max length with ellipsis."""
-    if not text:
-        return ""
-    if len(text) <= max_length:
-        return text
+    if not text or len(text) <= max_length:
+        return text or ""
     return text[: max_length - 3] + "..."
 
 
+def _cacheable_content(response: requests.Response) -> bool:
+    """Cache filter: 404s are only remembered for the optional JSON resume copies."""
+    return response.status_code != 404 or urlparse(response.url).path.endswith(".json")
+
+
+@lru_cache(maxsize=1)
+def _content_session() -> requests_cache.CachedSession:
+    """Shared disk-cached session for raw content (RSS feed, resume files).
+
+    Entries are kept for an hour and revalidated with ETag / Last-Modified
+    afterwards, so repeated runs skip unchanged downloads. Connections are
+    pooled and transient failures retried at the adapter level.
+    """
+    session = requests_cache.CachedSession(
+        cache_name=settings.content_cache_name,
+        backend="sqlite",
+        expire_after=3600,
+        # A missing JSON copy is remembered so later runs go straight to the
+        # YAML file; a missing required file is never pinned
+        allowable_codes=(200, 404),
+        filter_fn=_cacheable_content,
+    )
+    session.headers["User-Agent"] = "GitHub-Analysis-Tool/1.0"
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@ttl_cache(3600)
 def fetch_blog_posts(rss_url: str, max_posts: int = 5) -> List[Dict[str, str]]:
     """Fetch recent blog posts from RSS feed."""
     try:
-        response = requests.get(rss_url, timeout=10)
+        response = _content_session().get(rss_url, timeout=10)
         response.raise_for_status()
 
-        root = ET.fromstring(response.content)
-        channel = root.find("channel")
-        if channel is None:
-            return []
+        posts: List[Dict[str, str]] = []
+        if max_posts <= 0:
+            return posts
 
-        posts = []
-        for item in channel.findall("item")[:max_posts]:
-            title = item.find("title")
-            link = item.find("link")
-            pub_date = item.find("pubDate")
-            description = item.find("description")
+        # Stream <item> elements and stop once enough have been read instead
+        # of building the whole feed tree
+        for _, item in _xml_iterparse(
+            BytesIO(response.content), events=("end",), **_XML_PARSE_OPTIONS
+        ):
+            if item.tag != "item":
+                continue
 
             posts.append({
-                "title": title.text if title is not None else "",
-                "link": link.text if link is not None else "",
-                "pub_date": pub_date.text if pub_date is not None else "",
-                "description": truncate_text(description.text if description is not None else "", 150),
+                "title": item.findtext("title", ""),
+                "link": item.findtext("link", ""),
+                "pub_date": item.findtext("pubDate", ""),
+                "description": truncate_text(item.findtext("description", ""), 150),
             })
+            item.clear()
+            if len(posts) >= max_posts:
+                break
 
         return posts
     except Exception:
@@ -90,6 +362,9 @@ def fetch_blog_posts(rss_url: str, max_posts: int = 5) -> List[Dict[str, str]]:
 def fetch_resume_data(base_url: str) -> Dict[str, Any]:
     """Fetch and parse resume data from GitHub repository.
 
+    Results are cached for an hour; each call gets its own copy so callers
+    can modify it freely.
+
     Args:
         base_url: Base URL for raw GitHub content (e.g.,
             https://raw.githubusercontent.com/user/repo/main/data)
@@ -97,70 +372,72 @@ def fetch_resume_data(base_url: str) -> Dict[str, Any]:
     Returns:
         Dictionary with parsed resume data including skills categories.
     """
+    resume_data = _load_resume_data(base_url) or _EMPTY_RESUME
+    return {
+        **resume_data,
+        "skills": dict(resume_data["skills"]),
+        "certifications": list(resume_data["certifications"]),
+    }
+
+
+def _fetch_data_file(session: requests_cache.CachedSession, url_stem: str) -> Any:
+    """Fetch and parse a resume data file.
+
+    Reads ``<url_stem>.yaml``. With ``resume_prefer_json`` enabled a
+    pre-converted ``<url_stem>.json`` is tried first, falling back to the
+    YAML file when it is not published (404).
+    """
+    if settings.resume_prefer_json:
+        response = session.get(f"{url_stem}.json", timeout=10)
+        if response.status_code != 404:
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+    response = session.get(f"{url_stem}.yaml", timeout=10)
+    response.raise_for_status()
+    return yaml.load(response.content, Loader=_YAML_LOADER)
+
+
+@ttl_cache(3600)
+def _load_resume_data(base_url: str) -> Optional[Dict[str, Any]]:
+    """Download and parse the resume data files, or None if that fails."""
     resume_data: Dict[str, Any] = {
         "skills": {},
         "certifications": [],
     }
 
-    # Define badge colors for common technologies
-    badge_colors = {
-        # Languages
-        "go": "00ADD8", "python": "3776AB", "shell": "121011", "bash": "121011",
-        "typescript": "3178C6", "rust": "000000", "lua": "2C2D72",
-        # Cloud
-        "aws": "232F3E", "azure": "0078D4", "gcp": "4285F4",
-        # Containers & Orchestration
-        "kubernetes": "326CE5", "docker": "2496ED", "helm": "0F1689",
-        "kustomize": "326CE5", "podman": "892CA0",
-        # CI/CD & GitOps
-        "argocd": "EF7B4D", "github actions": "2088FF", "gitlab ci": "FC6D26",
-        "tekton": "FD495C", "jenkins": "D24939",
-        # IaC
-        "terraform": "7B42BC", "ansible": "EE0000", "pulumi": "8A3391",
-        "crossplane": "326CE5",
-        # Observability
-        "prometheus": "E6522C", "grafana": "F46800", "opentelemetry": "000000",
-        "jaeger": "66CFE3",
-        # DevSecOps
-        "sonarqube": "4E9BCD", "snyk": "4C4A73", "trivy": "1904DA",
-        "opa": "7D9199", "gatekeeper": "7D9199",
-        # Service Mesh
-        "istio": "466BB0", "linkerd": "2BEDA7", "envoy": "AC6199", "cilium": "F8C517",
-        # Databases & Messaging
-        "postgresql": "4169E1", "redis": "DC382D", "mongodb": "47A248",
-        "kafka": "231F20", "rabbitmq": "FF6600",
-    }
-
-    try:
-        # Fetch resume.ptbr.yaml
-        response = requests.get(f"{base_url}/resume.ptbr.yaml", timeout=10)
-        response.raise_for_status()
-        ptbr_data = yaml.safe_load(response.text)
-
-        # Extract skills from resume
-        if ptbr_data and "skills" in ptbr_data:
-            for skill_category in ptbr_data["skills"]:
-                category_name = skill_category.get("name", "")
-                keywords = skill_category.get("keywords", [])
-                if category_name and keywords:
-                    resume_data["skills"][category_name] = keywords
+    session = _content_session()
+    # The two files are independent, so download them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ptbr_future = executor.submit(_fetch_data_file, session, f"{base_url}/resume.ptbr")
+        common_future = executor.submit(_fetch_data_file, session, f"{base_url}/common")
 
-        # Try to fetch common.yaml for certifications
         try:
-            common_response = requests.get(f"{base_url}/common.yaml", timeout=10)
-            common_response.raise_for_status()
-            common_data = yaml.safe_load(common_response.text)
-            if common_data and "certifications" in common_data:
-                resume_data["certifications"] = common_data["certifications"]
-        except Exception:
-            pass
-
-    except Exception as e:
-        print(f"⚠ Error fetching resume data: {e}")
-        return resume_data
+            # Parse resume.ptbr
+            ptbr_data = ptbr_future.result()
+
+            # Extract skills from resume
+            if ptbr_data and "skills" in ptbr_data:
+                for skill_category in ptbr_data["skills"]:
+                    category_name = skill_category.get("name", "")
+                    keywords = skill_category.get("keywords", [])
+                    if category_name and keywords:
+                        resume_data["skills"][category_name] = keywords
+
+            # common is optional and only provides certifications
+            try:
+                common_data = common_future.result()
+                if common_data and "certifications" in common_data:
+                    resume_data["certifications"] = common_data["certifications"]
+            except Exception:
+                pass
+
+        except Exception as e:
+            print(f"⚠ Error fetching resume data: {e}")
+            return None
 
     # Add badge colors for reference
-    resume_data["badge_colors"] = badge_colors
+    resume_data["badge_colors"] = _BADGE_COLORS
 
     return resume_data
 
@@ -177,92 +454,4 @@ def format_skills_for_prompt(resume_data: Dict[str, Any]) -> str:
     if not resume_data.get("skills"):
         return "Dados do currículo não disponíveis."
 
-    # Technologies with valid shields.io logos (logo parameter works)
-    # Format: "display_name": ("logo_name", "hex_color")
-    valid_badges = {
-        # Languages
-        "Go": ("go", "00ADD8"),
-        "Python": ("python", "3776AB"),
-        "Shell": ("gnubash", "121011"),
-        "Bash": ("gnubash", "121011"),
-        "TypeScript": ("typescript", "3178C6"),
-        "Rust": ("rust", "000000"),
-        "Lua": ("lua", "2C2D72"),
-        # Cloud
-        "AWS": ("amazonwebservices", "232F3E"),
-        "Azure": ("microsoftazure", "0078D4"),
-        "GCP": ("googlecloud", "4285F4"),
-        # Containers & Orchestration
-        "Kubernetes": ("kubernetes", "326CE5"),
-        "Docker": ("docker", "2496ED"),
-        "Helm": ("helm", "0F1689"),
-        "Podman": ("podman", "892CA0"),
-        # CI/CD & GitOps
-        "ArgoCD": ("argo", "EF7B4D"),
-        "GitHub Actions": ("githubactions", "2088FF"),
-        "GitLab CI": ("gitlab", "FC6D26"),
-        "Tekton": ("tekton", "FD495C"),
-        "Jenkins": ("jenkins", "D24939"),
-        # IaC
-        "Terraform": ("terraform", "7B42BC"),
-        "Ansible": ("ansible", "EE0000"),
-        "Pulumi": ("pulumi", "8A3391"),
-        "Crossplane": ("crossplane", "326CE5"),
-        # Observability
-        "Prometheus": ("prometheus", "E6522C"),
-        "Grafana": ("grafana", "F46800"),
-        "OpenTelemetry": ("opentelemetry", "000000"),
-        "Jaeger": ("jaeger", "66CFE3"),
-        # DevSecOps
-        "SonarQube": ("sonarqube", "4E9BCD"),
-        "Snyk": ("snyk", "4C4A73"),
-        "Trivy": ("trivy", "1904DA"),
-        # Service Mesh
-        "Istio": ("istio", "466BB0"),
-        "Envoy": ("envoyproxy", "AC6199"),
-        "Cilium": ("cilium", "F8C517"),
-        # Databases & Messaging
-        "PostgreSQL": ("postgresql", "4169E1"),
-        "Redis": ("redis", "DC382D"),
-        "MongoDB": ("mongodb", "47A248"),
-        "Apache Kafka": ("apachekafka", "231F20"),
-        "RabbitMQ": ("rabbitmq", "FF6600"),
-        # Other tools
-        "Git": ("git", "F05032"),
-        "Linux": ("linux", "FCC624"),
-        "Nginx": ("nginx", "009639"),
-        "HashiCorp Vault": ("vault", "000000"),
-    }
-
-    lines = []
-    lines.append("**REGRA IMPORTANTE**: Use badges APENAS para tecnologias listadas abaixo.")
-    lines.append("NÃO misture badges com texto. Se a tecnologia não tem badge, NÃO a inclua.")
-    lines.append("")
-
-    # Group technologies by category
-    category_mapping = {
-        "Linguagens de Programação": ["Go", "Python", "Shell", "TypeScript", "Rust", "Lua"],
-        "Cloud & FinOps": ["AWS", "Azure", "GCP"],
-        "Orquestração de Containers": ["Kubernetes", "Docker", "Helm", "Podman"],
-        "CI/CD & GitOps": ["ArgoCD", "GitHub Actions", "GitLab CI", "Tekton", "Jenkins"],
-        "Infraestrutura como Código": ["Terraform", "Ansible", "Pulumi", "Crossplane"],
-        "Observabilidade": ["Prometheus", "Grafana", "OpenTelemetry", "Jaeger"],
-        "DevSecOps": ["SonarQube", "Snyk", "Trivy"],
-        "Service Mesh & Redes": ["Istio", "Envoy", "Cilium"],
-        "Bancos de Dados & Message Brokers": ["PostgreSQL", "Redis", "MongoDB", "Apache Kafka", "RabbitMQ"],
-    }
-
-    for category, techs in category_mapping.items():
-        lines.append(f"### {category}")
-        lines.append("")
-        badge_list = []
-        for tech in techs:
-            if tech in valid_badges:
-                logo, color = valid_badges[tech]
-                badge_list.append(
-                    f"![{tech}](https://img.shields.io/badge/{tech.replace(' ', '_')}-{color}?style=for-the-badge&logo={logo}&logoColor=white)"
-                )
-        lines.append(" ".join(badge_list))
-        lines.append("")
-
-    return "\n".join(lines)
+    return _BADGE_PROMPT_BLOCK
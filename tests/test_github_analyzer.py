@@ -0,0 +1,114 @@
+"""Tests for GitHubAnalyzer."""
+
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from src.github_analyzer import (
+    _GRAPHQL_PROFILE_QUERY,
+    _GRAPHQL_STARRED_PAGE_QUERY,
+    GitHubAnalyzer,
+)
+
+
+def _repo_node(name: str, private: bool = False) -> Dict[str, Any]:
+    return {
+        "databaseId": 1,
+        "name": name,
+        "nameWithOwner": f"octo/{name}",
+        "description": f"{name} description",
+        "url": f"https://github.com/octo/{name}",
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+        "stargazerCount": 1,
+        "forkCount": 0,
+        "updatedAt": "2024-01-01T00:00:00Z",
+        "hasWikiEnabled": False,
+        "hasIssuesEnabled": True,
+        "isPrivate": private,
+        "isFork": False,
+        "diskUsage": 10,
+        "issues": {"totalCount": 0},
+    }
+
+
+def _connection(key: str, items: List[Dict[str, Any]], cursor: str = "") -> Dict[str, Any]:
+    return {key: items, "pageInfo": {"hasNextPage": bool(cursor), "endCursor": cursor or None}}
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch) -> GitHubAnalyzer:
+    # Keep the on-disk response cache out of the working tree
+    monkeypatch.chdir(tmp_path)
+    return GitHubAnalyzer(token="test-token")
+
+
+def test_fetch_profile_bundle_excludes_private_starred_repos(analyzer, monkeypatch):
+    def edge(name: str, private: bool = False) -> Dict[str, Any]:
+        return {"starredAt": "2024-01-02T00:00:00Z", "node": _repo_node(name, private)}
+
+    profile = {
+        "user": {
+            "login": "octo",
+            "databaseId": 1,
+            "name": "Octo",
+            "bio": None,
+            "location": None,
+            "company": None,
+            "followers": {"totalCount": 0},
+            "publicRepos": {"totalCount": 1},
+            "repositories": _connection("nodes", [_repo_node("own")]),
+            "starredRepositories": _connection(
+                "edges", [edge("public-1"), edge("secret-1", private=True)], cursor="c1"
+            ),
+        }
+    }
+    next_page = {
+        "user": {
+            "starredRepositories": _connection(
+                "edges", [edge("secret-2", private=True), edge("public-2")]
+            )
+        }
+    }
+    responses = {_GRAPHQL_PROFILE_QUERY: profile, _GRAPHQL_STARRED_PAGE_QUERY: next_page}
+    monkeypatch.setattr(analyzer, "_graphql", lambda query, variables: responses[query])
+
+    bundle = analyzer.fetch_profile_bundle("octo")
+
+    assert bundle is not None
+    _, starred_repos, user_repos = bundle
+    assert [item["repo"]["name"] for item in starred_repos] == ["public-1", "public-2"]
+    assert all(not item["repo"]["private"] for item in starred_repos)
+    assert [repo["name"] for repo in user_repos] == ["own"]
+
+
+def _rate_limit_headers(remaining: int, reset_in: float) -> Dict[str, str]:
+    return {
+        "X-RateLimit-Limit": "60",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(time.time() + reset_in),
+        "X-RateLimit-Resource": "core",
+    }
+
+
+def test_rate_limit_delay_does_not_pause_while_budget_remains(analyzer):
+    analyzer._update_rate_limit(_rate_limit_headers(remaining=6, reset_in=3000))
+
+    assert analyzer._rate_limit_delay() == 0.0
+
+
+def test_rate_limit_delay_waits_briefly_for_an_imminent_reset(analyzer, capsys):
+    analyzer._update_rate_limit(_rate_limit_headers(remaining=0, reset_in=20))
+
+    assert 0 < analyzer._rate_limit_delay() <= 20
+    assert "waiting" in capsys.readouterr().out
+
+
+def test_rate_limit_delay_skips_long_waits_and_says_so(analyzer, capsys):
+    analyzer._update_rate_limit(_rate_limit_headers(remaining=0, reset_in=3000))
+
+    assert analyzer._rate_limit_delay() == 0.0
+    assert "not waiting" in capsys.readouterr().out
+    # The GraphQL budget is tracked separately and stays untouched
+    assert analyzer._rate_limit_delay("graphql") == 0.0
@@ -0,0 +1,86 @@
+"""Tests for the utility helpers."""
+
+from io import BytesIO
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from src import utils
+from src.config import settings
+
+BASE_URL = "https://raw.example.com/data"
+
+
+class _FakeContentAdapter(HTTPAdapter):
+    """Serve canned bodies by URL path and record every request that goes out."""
+
+    def __init__(self, files: Dict[str, Tuple[int, bytes]]):
+        super().__init__()
+        self.files = files
+        self.requested: List[str] = []
+
+    def send(self, request, **kwargs):
+        path = urlparse(request.url).path
+        self.requested.append(path)
+        status, body = self.files.get(path, (404, b"Not Found"))
+        raw = HTTPResponse(
+            body=BytesIO(body),
+            headers={"Content-Length": str(len(body))},
+            status=status,
+            reason="OK" if status == 200 else "Not Found",
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+@pytest.fixture
+def content_server(tmp_path, monkeypatch):
+    """Point the content session at a fresh cache and a fake raw-content host."""
+    monkeypatch.setattr(settings, "content_cache_name", str(tmp_path / "content"))
+    utils._content_session.cache_clear()
+    utils._load_resume_data.cache_clear()
+    adapter = _FakeContentAdapter(
+        {
+            "/data/resume.ptbr.yaml": (200, b"skills:\n  - name: Cloud\n    keywords: [aws]\n"),
+            "/data/common.yaml": (200, b"certifications: [CKA]\n"),
+        }
+    )
+    utils._content_session().mount("https://", adapter)
+    yield adapter
+    utils._content_session.cache_clear()
+    utils._load_resume_data.cache_clear()
+
+
+def test_resume_yaml_is_fetched_without_json_probe_by_default(content_server):
+    resume = utils.fetch_resume_data(BASE_URL)
+
+    assert resume["skills"] == {"Cloud": ["aws"]}
+    assert not [path for path in content_server.requested if path.endswith(".json")]
+
+
+def test_missing_json_copy_is_not_requested_again(content_server, monkeypatch):
+    monkeypatch.setattr(settings, "resume_prefer_json", True)
+
+    first = utils.fetch_resume_data(BASE_URL)
+    utils._load_resume_data.cache_clear()
+    content_server.requested.clear()
+    second = utils.fetch_resume_data(BASE_URL)
+
+    assert first == second
+    assert second["skills"] == {"Cloud": ["aws"]}
+    assert second["certifications"] == ["CKA"]
+    assert not [path for path in content_server.requested if path.endswith(".json")]
+
+
+def test_missing_required_yaml_is_not_cached(content_server):
+    del content_server.files["/data/resume.ptbr.yaml"]
+
+    assert utils.fetch_resume_data(BASE_URL)["skills"] == {}
+    utils._load_resume_data.cache_clear()
+    content_server.requested.clear()
+    utils.fetch_resume_data(BASE_URL)
+
+    assert "/data/resume.ptbr.yaml" in content_server.requested